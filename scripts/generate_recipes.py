@@ -3,6 +3,7 @@
 """
 HowToCook Recipe JSON Generator
 解析dishes目录下的Markdown文件，生成适配cooking模块的JSON格式
+同时解析tips和starsystem目录下的指南文档，生成结构化的指南JSON
 """
 
 import os
@@ -10,6 +11,7 @@ import re
 import json
 import hashlib
 from pathlib import Path
+from urllib.parse import unquote
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -431,8 +433,8 @@ class RecipeParser:
             print(f"解析 {file_path} 时出错: {e}")
             return None
             
-    def generate_recipes_json(self, output_file: str = 'all_recipes.json') -> None:
-        """生成菜谱JSON文件"""
+    def generate_recipes_json(self, output_file: str = 'all_recipes.json') -> List[Dict[str, Any]]:
+        """生成菜谱JSON文件，返回解析得到的菜谱列表"""
         # 加载之前的统计信息
         old_stats = self.load_previous_stats()
         
@@ -526,12 +528,180 @@ class RecipeParser:
         
         # 保存当前统计信息
         self.save_current_stats(current_stats)
+        
+        return recipes
+
+
+class GuideParser:
+    """指南解析器 - 解析tips和starsystem目录下的文档"""
+    
+    # 分类映射 - 从tips子目录名到中文名
+    CATEGORY_MAP = {
+        'tips': '基础知识',
+        'learn': '学习',
+        'advanced': '进阶'
+    }
+    
+    def __init__(self, tips_dir: str = 'tips', starsystem_dir: str = 'starsystem',
+                 dishes_dir: str = 'dishes'):
+        self.tips_dir = Path(tips_dir)
+        self.starsystem_dir = Path(starsystem_dir)
+        self.dishes_dir = Path(dishes_dir)
+        
+    def parse_sections(self, content: str) -> List[Dict[str, Any]]:
+        """按标题切分文档，返回各小节的标题、层级和正文"""
+        sections = []
+        current = None
+        in_code_block = False
+        
+        for line in content.split('\n'):
+            # 代码块中的 # 不视为标题
+            if line.strip().startswith('```'):
+                in_code_block = not in_code_block
+            
+            heading_match = None if in_code_block else re.match(r'^(#{1,6})\s+(.+?)\s*#*\s*$', line)
+            if heading_match:
+                if current is not None:
+                    current['content'] = current['content'].strip()
+                    sections.append(current)
+                current = {
+                    'heading': heading_match.group(2).strip(),
+                    'level': len(heading_match.group(1)),
+                    'content': ''
+                }
+            elif current is not None:
+                current['content'] += line + '\n'
+                
+        if current is not None:
+            current['content'] = current['content'].strip()
+            sections.append(current)
+            
+        return sections
+        
+    def parse_description(self, sections: List[Dict[str, Any]]) -> str:
+        """提取正文的第一段作为描述，若第一段是列表、引用等非正文内容则返回空字符串"""
+        for section in sections:
+            if not section['content']:
+                continue
+                
+            paragraph = []
+            for line in section['content'].split('\n'):
+                stripped_line = line.strip()
+                # 列表、引用、表格、图片和代码块不属于正文段落
+                if not stripped_line or re.match(r'^([-*+>|!]|\d+[.)]|```)', stripped_line):
+                    break
+                paragraph.append(stripped_line)
+                
+            return '\n'.join(paragraph)
+            
+        return ""
+        
+    def parse_linked_recipes(self, content: str, file_path: Path, recipe_ids: set) -> List[str]:
+        """提取文档中指向dishes目录的链接，并解析为菜谱ID"""
+        linked = []
+        dishes_root = self.dishes_dir.resolve()
+        
+        for href in re.findall(r'\[[^\]]*\]\(([^)\s]+\.md)\)', content):
+            if re.match(r'^[a-z]+://', href):
+                continue
+            target = (file_path.parent / unquote(href)).resolve()
+            try:
+                relative_path = target.relative_to(dishes_root)
+            except ValueError:
+                continue
+            recipe_id = str(relative_path).replace('\\', '/').replace('.md', '')
+            if recipe_id not in recipe_ids:
+                print(f"警告: {file_path} 中的链接 {href} 没有对应的菜谱")
+                continue
+            if recipe_id not in linked:
+                linked.append(recipe_id)
+                
+        return linked
+        
+    def parse_guide_file(self, file_path: Path, guide_type: str,
+                         recipe_ids: set) -> Optional[Dict[str, Any]]:
+        """解析单个指南文件"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                
+            title_match = re.search(r'^\s*#\s+(.+)', content, re.MULTILINE)
+            if not title_match:
+                print(f"警告: {file_path} 没有找到标题")
+                return None
+                
+            name = title_match.group(1).strip()
+            
+            # 生成唯一ID（包含顶层目录，避免与菜谱ID冲突）
+            source_dir = self.starsystem_dir if guide_type == 'starsystem' else self.tips_dir
+            relative_path = file_path.relative_to(source_dir.parent)
+            source_path = str(relative_path).replace('\\', '/')
+            guide_id = source_path.replace('.md', '')
+            
+            sections = self.parse_sections(content)
+            description = self.parse_description(sections)
+            
+            # starsystem文档的难度来自文件名，例如 3Star.md
+            difficulty = None
+            if guide_type == 'starsystem':
+                category = '难度分级'
+                difficulty_match = re.match(r'^(\d+)Star$', file_path.stem)
+                if difficulty_match:
+                    difficulty = int(difficulty_match.group(1))
+            else:
+                category = self.CATEGORY_MAP.get(file_path.parent.name, '其他')
+            
+            guide = {
+                'id': guide_id,
+                'name': name,
+                'description': description,
+                'source_path': source_path,
+                'type': guide_type,
+                'category': category,
+                'difficulty': difficulty,
+                'headings': [s['heading'] for s in sections if s['level'] > 1],
+                'sections': sections,
+                'linked_recipes': self.parse_linked_recipes(content, file_path, recipe_ids)
+            }
+            
+            return guide
+            
+        except Exception as e:
+            print(f"解析 {file_path} 时出错: {e}")
+            return None
+            
+    def generate_guides_json(self, recipes: List[Dict[str, Any]],
+                             output_file: str = 'all_guides.json') -> None:
+        """生成指南JSON文件，链接根据传入的菜谱列表解析"""
+        recipe_ids = {recipe['id'] for recipe in recipes}
+        guides = []
+        
+        sources = [(self.tips_dir, 'tip'), (self.starsystem_dir, 'starsystem')]
+        for source_dir, guide_type in sources:
+            if not source_dir.exists():
+                continue
+            for md_file in sorted(source_dir.rglob('*.md')):
+                guide = self.parse_guide_file(md_file, guide_type, recipe_ids)
+                if guide:
+                    guides.append(guide)
+                    
+        # 按类型和ID排序，starsystem按难度排序
+        guides.sort(key=lambda x: (x['type'], x['difficulty'] or 0, x['id']))
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(guides, f, ensure_ascii=False, indent=2)
+            
+        linked_count = sum(len(g['linked_recipes']) for g in guides)
+        print(f"生成完成! 共处理 {len(guides)} 个指南文档（关联菜谱链接 {linked_count} 个），输出到 {output_file}")
 
 
 def main():
     """主函数"""
     parser = RecipeParser()
-    parser.generate_recipes_json()
+    recipes = parser.generate_recipes_json()
+    
+    guide_parser = GuideParser()
+    guide_parser.generate_guides_json(recipes)
 
 
 if __name__ == '__main__':
@@ -125,5 +125,60 @@ def test_json_compatibility(json_file: str = 'all_recipes.json'):
     
     return len(missing_fields) == 0
 
+def test_guides_compatibility(json_file: str = 'all_guides.json', recipes_file: str = 'all_recipes.json'):
+    """测试指南JSON兼容性"""
+    print("🧪 测试指南JSON兼容性...")
+    
+    # 读取JSON数据
+    with open(json_file, 'r', encoding='utf-8') as f:
+        guides = json.load(f)
+    with open(recipes_file, 'r', encoding='utf-8') as f:
+        recipe_ids = {recipe.get('id') for recipe in json.load(f)}
+    
+    print(f"📋 总共 {len(guides)} 个指南文档")
+    
+    # 测试必需字段
+    required_fields = ['id', 'name', 'type', 'category', 'sections', 'linked_recipes']
+    errors = []
+    
+    for i, guide in enumerate(guides):
+        for field in required_fields:
+            if field not in guide:
+                errors.append(f"Guide {i}: missing {field}")
+        
+        # 关联菜谱必须存在于菜谱数据中
+        for recipe_id in guide.get('linked_recipes', []):
+            if recipe_id not in recipe_ids:
+                errors.append(f"Guide {guide.get('id', i)}: unknown linked recipe {recipe_id}")
+        
+        # 难度分级文档必须有难度
+        if guide.get('type') == 'starsystem' and guide.get('difficulty') is None:
+            errors.append(f"Guide {guide.get('id', i)}: starsystem entry without difficulty")
+    
+    # 类型统计
+    print(f"\n📊 类型统计:")
+    types = {}
+    for guide in guides:
+        guide_type = guide.get("type", "未知")
+        types[guide_type] = types.get(guide_type, 0) + 1
+    
+    for guide_type, count in sorted(types.items()):
+        print(f"  {guide_type}: {count} 个")
+    
+    linked_count = sum(len(guide.get('linked_recipes', [])) for guide in guides)
+    print(f"  关联菜谱链接: {linked_count} 个")
+    
+    # 错误报告
+    if errors:
+        print(f"\n❌ 发现问题:")
+        for error in errors:
+            print(f"  {error}")
+    else:
+        print(f"\n✅ 所有测试通过! 指南JSON格式完整且菜谱链接有效")
+    
+    return len(errors) == 0
+
 if __name__ == '__main__':
-    test_json_compatibility()
\ No newline at end of file
+    test_json_compatibility()
+    print()
+    test_guides_compatibility()
\ No newline at end of file